@@ -5,19 +5,26 @@ from __future__ import annotations
 import logging
 import time
 from datetime import datetime  # noqa: TC003
-from typing import Any, Self, cast
+from typing import TYPE_CHECKING, Any, Final, Self, cast
 
 import pandas as pd
 from pydantic import BaseModel, ConfigDict, Field, SecretStr, field_validator
 
 from .mt5 import Mt5Client, Mt5RuntimeError
 from .utils import (
+    convert_time_and_set_index_if_possible,
     detect_and_convert_time_to_datetime,
     set_index_if_possible,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
 logger = logging.getLogger(__name__)
 
+# MetaTrader5 RES_E_AUTH_FAILED; retrying with the same credentials cannot help.
+_MT5_AUTH_FAILED_ERROR_CODE: Final[int] = -6
+
 __all__ = ["Mt5Config", "Mt5DataClient"]
 
 
@@ -83,13 +90,24 @@ class Mt5DataClient(Mt5Client):
         """Return MT5 namedtuple-like results as dictionaries."""
         return [item._asdict() for item in items]
 
+    @staticmethod
+    def _as_records_df(items: Any) -> pd.DataFrame:  # noqa: ANN401
+        """Return MT5 namedtuple-like results as a DataFrame without row dicts."""
+        if not items:
+            return pd.DataFrame()
+        return pd.DataFrame.from_records(items, columns=items[0]._fields)
+
+    @staticmethod
+    def _as_array_df(array: Any) -> pd.DataFrame:  # noqa: ANN401
+        """Return an MT5 structured array as a DataFrame built column by column."""
+        return pd.DataFrame({name: array[name] for name in array.dtype.names})
+
     @staticmethod
     def _as_order_result_dict(result: Any) -> dict[str, Any]:  # noqa: ANN401
-        """Return order result data with nested request data flattened one level."""
-        return {
-            key: (value._asdict() if key == "request" else value)
-            for key, value in result._asdict().items()
-        }
+        """Return order result data with the nested request as a dictionary."""
+        data = result._asdict()
+        data["request"] = data["request"]._asdict()
+        return data
 
     @staticmethod
     def _as_record_dicts(df: pd.DataFrame) -> list[dict[str, Any]]:
@@ -119,9 +137,10 @@ class Mt5DataClient(Mt5Client):
             timeout: Connection timeout (overrides config).
 
         Raises:
-            Mt5RuntimeError: If initialization fails after retries.
+            Mt5RuntimeError: If initialization fails after retries, or at once
+                when MT5 reports an authorization failure.
         """
-        path = path or self.config.path
+        path_value = path if path is not None else self.config.path
         login_value = login if login is not None else self.config.login
         password_value = self._unwrap_password(
             password if password is not None else self.config.password
@@ -129,38 +148,41 @@ class Mt5DataClient(Mt5Client):
         server_value = server if server is not None else self.config.server
         timeout_value = timeout if timeout is not None else self.config.timeout
         last_error_value: tuple[int, str] | None = None
-        for i in range(1 + max(0, self.retry_count)):
-            if i:
+        retries = 0
+        for retries in range(1 + max(0, self.retry_count)):
+            if retries:
                 logger.warning(
                     "Retrying MT5 initialization (%d/%d)...",
-                    i,
+                    retries,
                     self.retry_count,
                 )
-                time.sleep(i)
-            if not self.initialize(
-                path=path,
+                time.sleep(retries)
+            if self.initialize(
+                path=path_value,
                 login=login_value,
                 password=password_value,
                 server=server_value,
                 timeout=timeout_value,
             ):
+                try:
+                    if login_value is None or self.login(
+                        login=login_value,
+                        password=password_value,
+                        server=server_value,
+                        timeout=timeout_value,
+                    ):
+                        return
+                except Exception:
+                    self.shutdown()
+                    raise
                 last_error_value = self.last_error()
-                continue
-            try:
-                if login_value is None or self.login(
-                    login=login_value,
-                    password=password_value,
-                    server=server_value,
-                    timeout=timeout_value,
-                ):
-                    return
-            except Exception:
                 self.shutdown()
-                raise
-            last_error_value = self.last_error()
-            self.shutdown()
+            else:
+                last_error_value = self.last_error()
+            if last_error_value[0] == _MT5_AUTH_FAILED_ERROR_CODE:
+                break
         error_message = (
-            f"MT5 initialize and login failed after {self.retry_count} retries:"
+            f"MT5 initialize and login failed after {retries} retries:"
             f" {last_error_value}"
         )
         raise Mt5RuntimeError(error_message)
@@ -268,8 +290,9 @@ class Mt5DataClient(Mt5Client):
         """
         return self._as_dicts(self.symbols_get(group=group))
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def symbols_get_as_df(
         self,
         group: str | None = None,
@@ -286,9 +309,7 @@ class Mt5DataClient(Mt5Client):
         Returns:
             DataFrame with symbol information.
         """
-        return pd.DataFrame(
-            self.symbols_get_as_dicts(group=group, skip_to_datetime=True)
-        )
+        return self._as_records_df(self.symbols_get(group=group))
 
     @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
     def symbol_info_as_dict(
@@ -307,8 +328,9 @@ class Mt5DataClient(Mt5Client):
         """
         return self.symbol_info(symbol=symbol)._asdict()
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def symbol_info_as_df(
         self,
         symbol: str,
@@ -346,8 +368,9 @@ class Mt5DataClient(Mt5Client):
         """
         return self.symbol_info_tick(symbol=symbol)._asdict()
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def symbol_info_tick_as_df(
         self,
         symbol: str,
@@ -385,8 +408,9 @@ class Mt5DataClient(Mt5Client):
         """
         return self._as_dicts(self.market_book_get(symbol=symbol))
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def market_book_get_as_df(
         self,
         symbol: str,
@@ -403,9 +427,7 @@ class Mt5DataClient(Mt5Client):
         Returns:
             DataFrame with market depth data.
         """
-        return pd.DataFrame(
-            self.market_book_get_as_dicts(symbol=symbol, skip_to_datetime=True)
-        )
+        return self._as_records_df(self.market_book_get(symbol=symbol))
 
     def copy_rates_from_as_dicts(
         self,
@@ -438,8 +460,9 @@ class Mt5DataClient(Mt5Client):
             )
         )
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def copy_rates_from_as_df(
         self,
         symbol: str,
@@ -463,7 +486,7 @@ class Mt5DataClient(Mt5Client):
             DataFrame with OHLCV data.
         """
         self._validate_positive_count(count=count)
-        return pd.DataFrame(
+        return self._as_array_df(
             self.copy_rates_from(
                 symbol=symbol,
                 timeframe=timeframe,
@@ -503,8 +526,9 @@ class Mt5DataClient(Mt5Client):
             )
         )
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def copy_rates_from_pos_as_df(
         self,
         symbol: str,
@@ -529,7 +553,7 @@ class Mt5DataClient(Mt5Client):
         """
         self._validate_positive_count(count=count)
         self._validate_non_negative_position(position=start_pos)
-        return pd.DataFrame(
+        return self._as_array_df(
             self.copy_rates_from_pos(
                 symbol=symbol,
                 timeframe=timeframe,
@@ -569,8 +593,9 @@ class Mt5DataClient(Mt5Client):
             )
         )
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def copy_rates_range_as_df(
         self,
         symbol: str,
@@ -594,7 +619,7 @@ class Mt5DataClient(Mt5Client):
             DataFrame with OHLCV data.
         """
         self._validate_date_range(date_from=date_from, date_to=date_to)
-        return pd.DataFrame(
+        return self._as_array_df(
             self.copy_rates_range(
                 symbol=symbol,
                 timeframe=timeframe,
@@ -634,8 +659,9 @@ class Mt5DataClient(Mt5Client):
             )
         )
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def copy_ticks_from_as_df(
         self,
         symbol: str,
@@ -659,7 +685,7 @@ class Mt5DataClient(Mt5Client):
             DataFrame with tick data.
         """
         self._validate_positive_count(count=count)
-        return pd.DataFrame(
+        return self._as_array_df(
             self.copy_ticks_from(
                 symbol=symbol,
                 date_from=date_from,
@@ -699,8 +725,9 @@ class Mt5DataClient(Mt5Client):
             )
         )
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def copy_ticks_range_as_df(
         self,
         symbol: str,
@@ -724,7 +751,7 @@ class Mt5DataClient(Mt5Client):
             DataFrame with tick data.
         """
         self._validate_date_range(date_from=date_from, date_to=date_to)
-        return pd.DataFrame(
+        return self._as_array_df(
             self.copy_ticks_range(
                 symbol=symbol,
                 date_from=date_from,
@@ -759,8 +786,9 @@ class Mt5DataClient(Mt5Client):
             self.orders_get(symbol=symbol, group=group, ticket=ticket)
         )
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def orders_get_as_df(
         self,
         symbol: str | None = None,
@@ -784,13 +812,8 @@ class Mt5DataClient(Mt5Client):
         Returns:
             DataFrame with order information or empty DataFrame if no orders.
         """
-        return pd.DataFrame(
-            self.orders_get_as_dicts(
-                symbol=symbol,
-                group=group,
-                ticket=ticket,
-                skip_to_datetime=True,
-            )
+        return self._as_records_df(
+            self.orders_get(symbol=symbol, group=group, ticket=ticket)
         )
 
     def order_check_as_dict(self, request: dict[str, Any]) -> dict[str, Any]:
@@ -884,8 +907,9 @@ class Mt5DataClient(Mt5Client):
             self.positions_get(symbol=symbol, group=group, ticket=ticket)
         )
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def positions_get_as_df(
         self,
         symbol: str | None = None,
@@ -909,13 +933,8 @@ class Mt5DataClient(Mt5Client):
         Returns:
             DataFrame with position information or empty DataFrame if no positions.
         """
-        return pd.DataFrame(
-            self.positions_get_as_dicts(
-                symbol=symbol,
-                group=group,
-                ticket=ticket,
-                skip_to_datetime=True,
-            )
+        return self._as_records_df(
+            self.positions_get(symbol=symbol, group=group, ticket=ticket)
         )
 
     @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
@@ -946,27 +965,21 @@ class Mt5DataClient(Mt5Client):
         Returns:
             List of dictionaries with historical order information.
         """
-        self._validate_history_input(
-            date_from=date_from,
-            date_to=date_to,
-            ticket=ticket,
-            position=position,
-            group=group,
-            symbol=symbol,
-        )
-        dicts = self._as_dicts(
-            self.history_orders_get(
+        return self._as_dicts(
+            self._get_history_records(
+                history_get=self.history_orders_get,
                 date_from=date_from,
                 date_to=date_to,
-                group=(f"*{symbol}*" if symbol else group),
+                group=group,
+                symbol=symbol,
                 ticket=ticket,
                 position=position,
             )
         )
-        return [d for d in dicts if d["symbol"] == symbol] if symbol else dicts
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def history_orders_get_as_df(
         self,
         date_from: datetime | None = None,
@@ -996,15 +1009,15 @@ class Mt5DataClient(Mt5Client):
         Returns:
             DataFrame with historical order information.
         """
-        return pd.DataFrame(
-            self.history_orders_get_as_dicts(
+        return self._as_records_df(
+            self._get_history_records(
+                history_get=self.history_orders_get,
                 date_from=date_from,
                 date_to=date_to,
                 group=group,
                 symbol=symbol,
                 ticket=ticket,
                 position=position,
-                skip_to_datetime=True,
             )
         )
 
@@ -1036,27 +1049,21 @@ class Mt5DataClient(Mt5Client):
         Returns:
             List of dictionaries with historical deal information.
         """
-        self._validate_history_input(
-            date_from=date_from,
-            date_to=date_to,
-            ticket=ticket,
-            position=position,
-            group=group,
-            symbol=symbol,
-        )
-        dicts = self._as_dicts(
-            self.history_deals_get(
+        return self._as_dicts(
+            self._get_history_records(
+                history_get=self.history_deals_get,
                 date_from=date_from,
                 date_to=date_to,
-                group=(f"*{symbol}*" if symbol else group),
+                group=group,
+                symbol=symbol,
                 ticket=ticket,
                 position=position,
             )
         )
-        return [d for d in dicts if d["symbol"] == symbol] if symbol else dicts
 
-    @set_index_if_possible(index_parameters="index_keys")
-    @detect_and_convert_time_to_datetime(skip_toggle="skip_to_datetime")
+    @convert_time_and_set_index_if_possible(
+        skip_toggle="skip_to_datetime", index_parameters="index_keys"
+    )
     def history_deals_get_as_df(
         self,
         date_from: datetime | None = None,
@@ -1086,18 +1093,59 @@ class Mt5DataClient(Mt5Client):
         Returns:
             DataFrame with historical deal information.
         """
-        return pd.DataFrame(
-            self.history_deals_get_as_dicts(
+        return self._as_records_df(
+            self._get_history_records(
+                history_get=self.history_deals_get,
                 date_from=date_from,
                 date_to=date_to,
                 group=group,
                 symbol=symbol,
                 ticket=ticket,
                 position=position,
-                skip_to_datetime=True,
             )
         )
 
+    def _get_history_records(
+        self,
+        history_get: Callable[..., tuple[Any, ...]],
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        group: str | None = None,
+        symbol: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+    ) -> Sequence[Any]:
+        """Fetch history records and keep only exact symbol matches.
+
+        Args:
+            history_get: Raw history getter, such as ``history_orders_get``.
+            date_from: Start date.
+            date_to: End date.
+            group: Group filter.
+            symbol: Exact symbol filter.
+            ticket: Order ticket.
+            position: Position ticket.
+
+        Returns:
+            Native MT5 history records.
+        """
+        self._validate_history_input(
+            date_from=date_from,
+            date_to=date_to,
+            ticket=ticket,
+            position=position,
+            group=group,
+            symbol=symbol,
+        )
+        records = history_get(
+            date_from=date_from,
+            date_to=date_to,
+            group=(f"*{symbol}*" if symbol else group),
+            ticket=ticket,
+            position=position,
+        )
+        return [r for r in records if r.symbol == symbol] if symbol else records
+
     def _validate_history_input(
         self,
         date_from: datetime | None = None,
@@ -1221,11 +1269,12 @@ class Mt5DataClient(Mt5Client):
         Returns:
             Flattened dictionary.
         """
-        items: list[tuple[str, Any]] = []
+        flattened: dict[str, Any] = {}
         for k, v in dictionary.items():
             if isinstance(v, dict):
-                nested = cast("dict[str, Any]", v)
-                items.extend((f"{k}{sep}{sk}", sv) for sk, sv in nested.items())
+                prefix = f"{k}{sep}"
+                for sk, sv in cast("dict[str, Any]", v).items():
+                    flattened[prefix + sk] = sv
             else:
-                items.append((k, v))
-        return dict(items)
+                flattened[k] = v
+        return flattened
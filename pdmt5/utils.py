@@ -3,19 +3,21 @@
 from __future__ import annotations
 
 import inspect
-from functools import wraps
-from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, cast
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Any, Literal, ParamSpec, TypeVar, cast
 
 import pandas as pd
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
 __all__: list[str] = []
 
+_NANOSECONDS_PER_EPOCH_UNIT = {"s": 1_000_000_000, "ms": 1_000_000}
+
 
 def detect_and_convert_time_to_datetime(
     skip_toggle: str | None = None,
@@ -75,6 +77,47 @@ def detect_and_convert_time_to_datetime(
     return decorator
 
 
+def convert_time_and_set_index_if_possible(
+    skip_toggle: str | None = None,
+    index_parameters: str | None = None,
+) -> Callable[[Callable[P, pd.DataFrame]], Callable[P, pd.DataFrame]]:
+    """Decorator to convert time columns and then set index on DataFrame results.
+
+    Equivalent to stacking ``set_index_if_possible`` over
+    ``detect_and_convert_time_to_datetime`` while binding the call arguments
+    only once.
+
+    Args:
+        skip_toggle: Name of the bound parameter that skips conversion when
+            its value is truthy.
+        index_parameters: Name of the parameter to use as index if provided.
+
+    Returns:
+        Decorator function.
+    """
+
+    def decorator(
+        func: Callable[P, pd.DataFrame],
+    ) -> Callable[P, pd.DataFrame]:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> pd.DataFrame:
+            bound_arguments = signature.bind_partial(*args, **kwargs).arguments
+            result = _validate_dataframe_result(func=func, result=func(*args, **kwargs))
+            if not (skip_toggle and bound_arguments.get(skip_toggle)):
+                result = _convert_time_columns_in_df(result)
+            return _set_index_from_arguments(
+                df=result,
+                bound_arguments=bound_arguments,
+                index_parameters=index_parameters,
+            )
+
+        return wrapper
+
+    return decorator
+
+
 def _convert_time_values_in_dict(dictionary: dict[str, Any]) -> dict[str, Any]:
     """Convert time values in a dictionary to datetime.
 
@@ -85,16 +128,37 @@ def _convert_time_values_in_dict(dictionary: dict[str, Any]) -> dict[str, Any]:
         Dictionary with converted time values.
     """
     new_dict = dictionary.copy()
-    for k, v in new_dict.items():
-        if not isinstance(v, (int, float)):
-            continue
-        elif k.startswith("time_") and k.endswith("_msc"):
-            new_dict[k] = pd.to_datetime(v, unit="ms")
-        elif k == "time" or k.startswith("time_"):
-            new_dict[k] = pd.to_datetime(v, unit="s")
+    for k, unit in _classify_time_keys(tuple(new_dict)):
+        v = new_dict[k]
+        if isinstance(v, (int, float)):
+            new_dict[k] = pd.Timestamp(v, unit=unit)
     return new_dict
 
 
+@lru_cache(maxsize=256)
+def _classify_time_keys(
+    keys: tuple[str, ...],
+) -> tuple[tuple[str, Literal["s", "ms"]], ...]:
+    """Return time keys with their epoch units.
+
+    MT5 responses reuse a fixed set of field names, so results are cached per
+    key tuple.
+
+    Args:
+        keys: Dictionary keys or DataFrame column names.
+
+    Returns:
+        Pairs of time key and epoch unit, in key order.
+    """
+    time_keys: list[tuple[str, Literal["s", "ms"]]] = []
+    for k in keys:
+        if k.startswith("time_") and k.endswith("_msc"):
+            time_keys.append((k, "ms"))
+        elif k == "time" or k.startswith("time_"):
+            time_keys.append((k, "s"))
+    return tuple(time_keys)
+
+
 def _convert_time_columns_in_df(df: pd.DataFrame) -> pd.DataFrame:
     """Convert time columns in DataFrame to datetime.
 
@@ -104,13 +168,51 @@ def _convert_time_columns_in_df(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with converted time columns.
     """
-    new_df = df.copy()
-    for c in new_df.columns:
-        if c.startswith("time_") and c.endswith("_msc"):
-            new_df[c] = pd.to_datetime(new_df[c], unit="ms").astype("datetime64[ns]")
-        elif c == "time" or c.startswith("time_"):
-            new_df[c] = pd.to_datetime(new_df[c], unit="s").astype("datetime64[ns]")
-    return new_df
+    return df.assign(**{
+        c: _convert_epoch_series_to_datetime(df[c], unit=unit)
+        for c, unit in _classify_time_keys(tuple(df.columns))
+    })
+
+
+def _convert_epoch_series_to_datetime(
+    series: pd.Series[Any],
+    unit: Literal["s", "ms"],
+) -> pd.Series[Any]:
+    """Convert a Series of epoch values to datetime64[ns] values.
+
+    NumPy integer epochs are scaled to nanoseconds and reinterpreted without
+    parsing; other values fall back to ``pd.to_datetime``.
+
+    Args:
+        series: Series of epoch values.
+        unit: Unit of the epoch values.
+
+    Returns:
+        Series of datetime64[ns] values.
+
+    Raises:
+        OutOfBoundsDatetime: If an integer epoch is outside the datetime64[ns]
+            range.
+    """
+    if series.dtype.kind in {"i", "u"} and not isinstance(
+        series.dtype, pd.api.extensions.ExtensionDtype
+    ):
+        factor = _NANOSECONDS_PER_EPOCH_UNIT[unit]
+        limit = pd.Timestamp.max.value // factor
+        if not series.empty and (series.min() < -limit or series.max() > limit):
+            error_message = (
+                f"Epoch values in {series.name!r} are out of bounds for"
+                f" datetime64[ns] with unit {unit!r}."
+            )
+            raise pd.errors.OutOfBoundsDatetime(error_message)
+        return pd.Series(
+            (series.to_numpy(dtype="int64") * factor).view("datetime64[ns]"),
+            index=series.index,
+            name=series.name,
+            copy=False,
+        )
+    else:
+        return pd.to_datetime(series, unit=unit).astype("datetime64[ns]")
 
 
 def set_index_if_possible(
@@ -133,22 +235,58 @@ def set_index_if_possible(
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> pd.DataFrame:
             bound_arguments = signature.bind_partial(*args, **kwargs).arguments
-            result = func(*args, **kwargs)
-            if not isinstance(result, pd.DataFrame):  # type: ignore[reportUnnecessaryIsInstance]
-                error_message = (
-                    f"Function {func.__name__} returned non-DataFrame result: "
-                    f"{type(result).__name__}. Expected DataFrame."
-                )
-                raise TypeError(error_message)
-            elif (
-                index_parameters
-                and bound_arguments.get(index_parameters)
-                and not result.empty
-            ):
-                return result.set_index(bound_arguments[index_parameters])
-            else:
-                return result
+            return _set_index_from_arguments(
+                df=_validate_dataframe_result(func=func, result=func(*args, **kwargs)),
+                bound_arguments=bound_arguments,
+                index_parameters=index_parameters,
+            )
 
         return wrapper
 
     return decorator
+
+
+def _validate_dataframe_result(
+    func: Callable[..., Any],
+    result: object,
+) -> pd.DataFrame:
+    """Validate that a decorated function returned a DataFrame.
+
+    Args:
+        func: Decorated function.
+        result: Result returned by the function.
+
+    Returns:
+        The result as a DataFrame.
+
+    Raises:
+        TypeError: If the result is not a DataFrame.
+    """
+    if not isinstance(result, pd.DataFrame):
+        error_message = (
+            f"Function {func.__name__} returned non-DataFrame result: "
+            f"{type(result).__name__}. Expected DataFrame."
+        )
+        raise TypeError(error_message)
+    return result
+
+
+def _set_index_from_arguments(
+    df: pd.DataFrame,
+    bound_arguments: Mapping[str, Any],
+    index_parameters: str | None,
+) -> pd.DataFrame:
+    """Set index on a non-empty DataFrame from a bound call argument.
+
+    Args:
+        df: DataFrame to index.
+        bound_arguments: Arguments bound to the decorated function.
+        index_parameters: Name of the parameter to use as index if provided.
+
+    Returns:
+        DataFrame with index set if requested, otherwise the input DataFrame.
+    """
+    if index_parameters and bound_arguments.get(index_parameters) and not df.empty:
+        return df.set_index(bound_arguments[index_parameters])
+    else:
+        return df
@@ -408,92 +408,83 @@ class MockBookInfo(NamedTuple):
     volume_real: float
 
 
-class _MockOrderNoTimeExpiration:
+class _MockOrderNoTimeExpiration(NamedTuple):
     """Mock order row omitting the time_expiration column."""
 
-    def _asdict(self) -> dict[str, Any]:
-        return {
-            "ticket": 123456,
-            "time_setup": 1640995200,
-            "time_setup_msc": 1640995200000,
-            "time_done": 0,
-            "time_done_msc": 0,
-            "type": 0,
-            "type_time": 0,
-            "type_filling": 0,
-            "state": 1,
-            "magic": 0,
-            "position_id": 0,
-            "position_by_id": 0,
-            "reason": 0,
-            "volume_initial": 0.1,
-            "volume_current": 0.1,
-            "price_open": 1.1300,
-            "sl": 1.1200,
-            "tp": 1.1400,
-            "price_current": 1.1301,
-            "price_stoplimit": 0.0,
-            "symbol": "EURUSD",
-            "comment": "",
-            "external_id": "",
-        }
-
-
-class _MockPositionNoTimeUpdate:
+    ticket: int = 123456
+    time_setup: int = 1640995200
+    time_setup_msc: int = 1640995200000
+    time_done: int = 0
+    time_done_msc: int = 0
+    type: int = 0
+    type_time: int = 0
+    type_filling: int = 0
+    state: int = 1
+    magic: int = 0
+    position_id: int = 0
+    position_by_id: int = 0
+    reason: int = 0
+    volume_initial: float = 0.1
+    volume_current: float = 0.1
+    price_open: float = 1.1300
+    sl: float = 1.1200
+    tp: float = 1.1400
+    price_current: float = 1.1301
+    price_stoplimit: float = 0.0
+    symbol: str = "EURUSD"
+    comment: str = ""
+    external_id: str = ""
+
+
+class _MockPositionNoTimeUpdate(NamedTuple):
     """Mock position row omitting the time_update column."""
 
-    def _asdict(self) -> dict[str, Any]:
-        return {
-            "ticket": 123456,
-            "time": 1640995200,
-            "time_msc": 1640995200000,
-            "time_update_msc": 1640995200000,
-            "type": 0,
-            "magic": 0,
-            "identifier": 123456,
-            "reason": 0,
-            "volume": 0.1,
-            "price_open": 1.1300,
-            "sl": 1.1200,
-            "tp": 1.1400,
-            "price_current": 1.1301,
-            "swap": 0.0,
-            "profit": 10.0,
-            "symbol": "EURUSD",
-            "comment": "",
-            "external_id": "",
-        }
-
-
-class _MockOrderNoTimeDone:
+    ticket: int = 123456
+    time: int = 1640995200
+    time_msc: int = 1640995200000
+    time_update_msc: int = 1640995200000
+    type: int = 0
+    magic: int = 0
+    identifier: int = 123456
+    reason: int = 0
+    volume: float = 0.1
+    price_open: float = 1.1300
+    sl: float = 1.1200
+    tp: float = 1.1400
+    price_current: float = 1.1301
+    swap: float = 0.0
+    profit: float = 10.0
+    symbol: str = "EURUSD"
+    comment: str = ""
+    external_id: str = ""
+
+
+class _MockOrderNoTimeDone(NamedTuple):
     """Mock history order row omitting the time_done column."""
 
-    def _asdict(self) -> dict[str, Any]:
-        return {
-            "ticket": 123456,
-            "time_setup": 1640995200,
-            "time_setup_msc": 1640995200000,
-            "time_done_msc": 0,
-            "time_expiration": 0,
-            "type": 0,
-            "type_time": 0,
-            "type_filling": 0,
-            "state": 1,
-            "magic": 0,
-            "position_id": 0,
-            "position_by_id": 0,
-            "reason": 0,
-            "volume_initial": 0.1,
-            "volume_current": 0.1,
-            "price_open": 1.1300,
-            "sl": 1.1200,
-            "tp": 1.1400,
-            "price_current": 1.1301,
-            "price_stoplimit": 0.0,
-            "symbol": "EURUSD",
-            "comment": "",
-            "external_id": "",
-        }
+    ticket: int = 123456
+    time_setup: int = 1640995200
+    time_setup_msc: int = 1640995200000
+    time_done_msc: int = 0
+    time_expiration: int = 0
+    type: int = 0
+    type_time: int = 0
+    type_filling: int = 0
+    state: int = 1
+    magic: int = 0
+    position_id: int = 0
+    position_by_id: int = 0
+    reason: int = 0
+    volume_initial: float = 0.1
+    volume_current: float = 0.1
+    price_open: float = 1.1300
+    sl: float = 1.1200
+    tp: float = 1.1400
+    price_current: float = 1.1301
+    price_stoplimit: float = 0.0
+    symbol: str = "EURUSD"
+    comment: str = ""
+    external_id: str = ""
 
 
 def _mock_order_no_time_expiration() -> object:
@@ -565,18 +556,15 @@ def _build_history_deal_row(position_id: int) -> MockDeal:
     )
 
 
-class _MockSymbolRow:
+class _MockSymbolRow(NamedTuple):
     """Mock symbol row with a minimal set of fields, including time columns."""
 
-    def _asdict(self) -> dict[str, Any]:
-        return {
-            "name": "EURUSD",
-            "time": 1640995200,
-            "time_msc": 1640995200000,
-            "time_digits": 1640995200,
-            "bid": 1.1300,
-            "ask": 1.1301,
-        }
+    name: str = "EURUSD"
+    time: int = 1640995200
+    time_msc: int = 1640995200000
+    time_digits: int = 1640995200
+    bid: float = 1.1300
+    ask: float = 1.1301
 
 
 class TestMt5Config:
@@ -900,6 +888,43 @@ class TestMt5DataClient:
 
         mock_mt5_import.shutdown.assert_called_once()
 
+    @pytest.mark.parametrize(
+        ("initialize_result", "login_result"),
+        [
+            pytest.param(False, True, id="initialize-fails"),
+            pytest.param(True, False, id="login-fails"),
+        ],
+    )
+    def test_initialize_and_login_stops_retrying_after_auth_failure(
+        self,
+        mock_mt5_import: ModuleType | None,
+        mocker: MockerFixture,
+        initialize_result: bool,
+        login_result: bool,
+    ) -> None:
+        """Test authorization failures are not retried."""
+        assert mock_mt5_import is not None
+        mock_mt5_import.initialize.return_value = initialize_result
+        mock_mt5_import.login.return_value = login_result
+        mock_mt5_import.last_error.return_value = (
+            -6,
+            "Terminal: Authorization failed",
+        )
+        mock_sleep = mocker.patch("pdmt5.dataframe.time.sleep")
+        client = Mt5DataClient(
+            mt5=mock_mt5_import,
+            config=Mt5Config(login=123456, password="secret", server="Demo"),
+            retry_count=3,
+        )
+
+        with pytest.raises(
+            Mt5RuntimeError, match=r"MT5 initialize and login failed after 0 retries"
+        ):
+            client.initialize_and_login_mt5()
+
+        mock_mt5_import.initialize.assert_called_once()
+        mock_sleep.assert_not_called()
+
     def test_initialize_and_login_shuts_down_after_login_exception(
         self, mock_mt5_import: ModuleType | None
     ) -> None:
@@ -924,6 +949,38 @@ class TestMt5DataClient:
 
         mock_mt5_import.shutdown.assert_called_once()
 
+    def test_initialize_and_login_prefers_explicit_overrides(
+        self, mock_mt5_import: ModuleType | None
+    ) -> None:
+        """Test explicit falsy arguments such as path="" and login=0 override config."""
+        assert mock_mt5_import is not None
+        mock_mt5_import.initialize.return_value = True
+        mock_mt5_import.login.return_value = True
+        config = Mt5Config(
+            path="/config/mt5.exe",
+            login=123456,
+            password="config-secret",
+            server="Config",
+            timeout=60000,
+        )
+        client = Mt5DataClient(mt5=mock_mt5_import, config=config, retry_count=0)
+
+        client.initialize_and_login_mt5(
+            path="",
+            login=0,
+            password="secret",
+            server="Demo",
+            timeout=1000,
+        )
+
+        mock_mt5_import.initialize.assert_called_once_with(
+            "",
+            login=0,
+            password="secret",
+            server="Demo",
+            timeout=1000,
+        )
+
     def test_initialize_and_login_unwraps_secret_password_override(
         self, mock_mt5_import: ModuleType | None
     ) -> None:
@@ -1842,6 +1899,87 @@ class TestMt5DataClient:
         assert len(df_result) == 1
         assert missing_column not in df_result.columns
 
+    @pytest.mark.parametrize(
+        ("client_method", "mt5_method", "row_factory", "extra_args"),
+        [
+            pytest.param(
+                "symbols_get_as_df",
+                "symbols_get",
+                _MockSymbolRow,
+                (),
+                id="symbols",
+            ),
+            pytest.param(
+                "market_book_get_as_df",
+                "market_book_get",
+                lambda: MockBookInfo(type=1, price=1.13, volume=1.0, volume_real=1.0),
+                ("EURUSD",),
+                id="market-book",
+            ),
+            pytest.param(
+                "orders_get_as_df",
+                "orders_get",
+                _mock_order_no_time_expiration,
+                (),
+                id="orders",
+            ),
+            pytest.param(
+                "positions_get_as_df",
+                "positions_get",
+                _mock_position_no_time_update,
+                (),
+                id="positions",
+            ),
+            pytest.param(
+                "history_orders_get_as_df",
+                "history_orders_get",
+                lambda: _build_history_order_row(0),
+                (datetime(2022, 1, 1, tzinfo=UTC), datetime(2022, 1, 2, tzinfo=UTC)),
+                id="history-orders",
+            ),
+            pytest.param(
+                "history_deals_get_as_df",
+                "history_deals_get",
+                lambda: _build_history_deal_row(0),
+                (datetime(2022, 1, 1, tzinfo=UTC), datetime(2022, 1, 2, tzinfo=UTC)),
+                id="history-deals",
+            ),
+        ],
+    )
+    def test_get_as_df_builds_from_records_without_row_dicts(
+        self,
+        mock_mt5_import: ModuleType,
+        mocker: MockerFixture,
+        client_method: str,
+        mt5_method: str,
+        row_factory: Callable[[], Any],
+        extra_args: tuple[Any, ...],
+    ) -> None:
+        """Test DataFrame getters build columns from rows, not per-row dicts."""
+        row = row_factory()
+        getattr(mock_mt5_import, mt5_method).return_value = [row, row]
+        client = create_initialized_client(mock_mt5_import)
+        as_dicts = mocker.spy(Mt5DataClient, "_as_dicts")
+
+        df_result = getattr(client, client_method)(*extra_args)
+
+        as_dicts.assert_not_called()
+        assert df_result.columns.tolist() == list(row._fields)
+        assert len(df_result) == 2
+
+    def test_as_array_df_copies_structured_fields(self) -> None:
+        """Test _as_array_df keeps field dtypes in contiguous column copies."""
+        rates = _create_mock_rates()
+
+        result = Mt5DataClient._as_array_df(rates)  # type: ignore[reportPrivateUsage]
+
+        assert list(result.columns) == list(rates.dtype.names or ())
+        assert list(result.dtypes) == [rates.dtype[n] for n in result.columns]
+        assert not any(
+            np.shares_memory(result[c].to_numpy(), rates) for c in result.columns
+        )
+        assert all(result[c].to_numpy().flags.c_contiguous for c in result.columns)
+
 
 class TestMt5DataClientValidation:
     """Test Mt5DataClient validation methods."""
@@ -2745,14 +2883,11 @@ class TestMt5DataClientCoverageMissing:
     ) -> None:
         """Test positional skip_to_datetime and index_keys arguments are honored."""
 
-        class MockSymbol:
-            def _asdict(self) -> dict[str, Any]:
-                return {
-                    "name": "EURUSD",
-                    "time": 1640995200,
-                    "bid": 1.1300,
-                    "ask": 1.1301,
-                }
+        class MockSymbol(NamedTuple):
+            name: str = "EURUSD"
+            time: int = 1640995200
+            bid: float = 1.1300
+            ask: float = 1.1301
 
         mock_mt5_import.symbols_get.return_value = [MockSymbol()]
         client = create_initialized_client(mock_mt5_import)
@@ -3342,14 +3477,11 @@ class TestMt5DataClientCoverageMissing:
         client = Mt5DataClient(mt5=mock_mt5_import)
 
         # Mock symbol data
-        class MockSymbol:
-            def _asdict(self) -> dict[str, Any]:
-                return {
-                    "name": "EURUSD",
-                    "time": 1640995200,
-                    "bid": 1.1300,
-                    "ask": 1.1301,
-                }
+        class MockSymbol(NamedTuple):
+            name: str = "EURUSD"
+            time: int = 1640995200
+            bid: float = 1.1300
+            ask: float = 1.1301
 
         mock_mt5_import.symbols_get.return_value = [MockSymbol()]
         mock_mt5_import.initialize.return_value = True
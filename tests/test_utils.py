@@ -7,13 +7,30 @@ import pandas as pd
 import pytest
 
 from pdmt5.utils import (
+    _classify_time_keys,  # type: ignore[reportPrivateUsage]
     _convert_time_columns_in_df,  # type: ignore[reportPrivateUsage]
     _convert_time_values_in_dict,  # type: ignore[reportPrivateUsage]
+    convert_time_and_set_index_if_possible,
     detect_and_convert_time_to_datetime,
     set_index_if_possible,
 )
 
 
+class TestClassifyTimeKeys:
+    """Test _classify_time_keys function."""
+
+    def test_classify_time_keys(self) -> None:
+        """Test time keys are returned in order with their epoch units."""
+        keys = ("ticket", "time", "time_msc", "time_setup", "timeframe", "price")
+
+        assert _classify_time_keys(keys) == (
+            ("time", "s"),
+            ("time_msc", "ms"),
+            ("time_setup", "s"),
+        )
+        assert _classify_time_keys(keys) is _classify_time_keys(keys)
+
+
 class TestConvertTimeValuesInDict:
     """Test _convert_time_values_in_dict function."""
 
@@ -177,6 +194,13 @@ class TestConvertTimeColumnsInDf:
                 False,
                 id="prefixed-seconds",
             ),
+            pytest.param(
+                lambda: pd.DataFrame({"time": [1704067200.5, 1704067260.0]}),
+                {"time": "datetime64[ns]"},
+                [("time", 0, pd.Timestamp("2024-01-01 00:00:00.500"))],
+                False,
+                id="float-seconds",
+            ),
             pytest.param(
                 pd.DataFrame,
                 {},
@@ -225,6 +249,26 @@ class TestConvertTimeColumnsInDf:
             if isinstance(expected_value, pd.Timestamp):
                 assert isinstance(value, pd.Timestamp)
             assert value == expected_value
+        pd.testing.assert_frame_equal(data_df, original_df)
+
+    @pytest.mark.parametrize(
+        ("column", "value"),
+        [
+            pytest.param("time", 2**40, id="seconds-overflow"),
+            pytest.param("time", -(2**40), id="seconds-underflow"),
+            pytest.param("time_msc", 2**60, id="milliseconds-overflow"),
+        ],
+    )
+    def test_convert_time_columns_in_df_out_of_bounds(
+        self,
+        column: str,
+        value: int,
+    ) -> None:
+        """Test out-of-range integer epochs raise instead of wrapping."""
+        data_df = pd.DataFrame({column: [0, value]})
+
+        with pytest.raises(pd.errors.OutOfBoundsDatetime, match="out of bounds"):
+            _convert_time_columns_in_df(data_df)
 
 
 def _assert_dict_time_converted(result: object) -> None:
@@ -445,3 +489,73 @@ class TestSetIndexIfPossible:
         result = get_data(index_keys=["date", "symbol"])
         assert isinstance(result.index, pd.MultiIndex)
         assert result.index.names == ["date", "symbol"]
+
+
+class TestConvertTimeAndSetIndexIfPossible:
+    """Test convert_time_and_set_index_if_possible decorator."""
+
+    @pytest.mark.parametrize(
+        ("call_kwargs", "expected_index_dtype", "expected_index_name"),
+        [
+            pytest.param({"index_keys": "time"}, "datetime64[ns]", "time", id="index"),
+            pytest.param(
+                {"index_keys": "time", "skip_to_datetime": True},
+                "int64",
+                "time",
+                id="index-skip",
+            ),
+            pytest.param({}, "int64", None, id="no-index"),
+        ],
+    )
+    def test_decorator_converts_time_before_setting_index(
+        self,
+        call_kwargs: dict[str, Any],
+        expected_index_dtype: str,
+        expected_index_name: str | None,
+    ) -> None:
+        """Test time columns are converted before the index is set."""
+
+        @convert_time_and_set_index_if_possible(
+            skip_toggle="skip_to_datetime", index_parameters="index_keys"
+        )
+        def get_data(
+            skip_to_datetime: bool = False,  # noqa: ARG001
+            index_keys: str | None = None,  # noqa: ARG001
+        ) -> pd.DataFrame:
+            return pd.DataFrame({
+                "time": [1704067200, 1704067260],
+                "price": [100.5, 100.6],
+            })
+
+        result = get_data(**call_kwargs)
+        assert result.index.dtype == expected_index_dtype
+        assert result.index.name == expected_index_name
+
+    def test_decorator_with_empty_dataframe(self) -> None:
+        """Test decorator leaves empty DataFrames without index."""
+
+        @convert_time_and_set_index_if_possible(
+            skip_toggle="skip_to_datetime", index_parameters="index_keys"
+        )
+        def get_data(index_keys: str | None = None) -> pd.DataFrame:  # noqa: ARG001
+            return pd.DataFrame()
+
+        result = get_data(index_keys="time")
+        assert result.empty
+        assert result.index.name is None
+
+    def test_decorator_with_non_dataframe_raises(self) -> None:
+        """Test decorator raises TypeError for non-DataFrame return."""
+
+        @convert_time_and_set_index_if_possible()  # type: ignore[arg-type]
+        def get_data() -> dict[str, Any]:
+            return {"time": 1704067200}
+
+        with pytest.raises(
+            TypeError,
+            match=(
+                r"Function get_data returned non-DataFrame result: "
+                r"dict\. Expected DataFrame\."
+            ),
+        ):
+            get_data()